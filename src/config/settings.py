@@ -1,40 +1,78 @@
 """Application settings and configuration."""
 
-from pydantic_settings import BaseSettings
-from pydantic import Field
+import os
 from functools import lru_cache
 
+import msgspec
+from msgspec.structs import fields
 
-class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
+
+class Settings(msgspec.Struct, frozen=True):
+    """Application settings loaded from environment variables.
+
+    A frozen ``msgspec.Struct`` built once from ``os.environ`` (each field
+    maps to its upper-cased name, e.g. ``OPENAI_API_KEY``); this keeps
+    startup free of Pydantic's validation machinery.
+    """
 
     # OpenAI Configuration
-    openai_api_key: str = Field(default="", description="OpenAI API Key")
-    openai_model: str = Field(default="gpt-4.1-nano", description="OpenAI model to use")
+    openai_api_key: str = ""
+    openai_model: str = "gpt-4.1-nano"
+    llm_max_retries: int = 3
+
+    # Per-stage model routing (empty = fall back to openai_model). The absorb
+    # stage runs once per sampled member on a structured classification, so it
+    # is the one worth pointing at the smallest model; compile and follow-up
+    # run once per aspiration and can afford a stronger model.
+    absorb_model: str = ""
+    compile_model: str = ""
+    followup_model: str = ""
 
     # Cost Configuration (per 1k tokens)
-    prompt_cost_per_1k: float = Field(default=0.0001, description="Cost per 1k prompt tokens")
-    completion_cost_per_1k: float = Field(default=0.0004, description="Cost per 1k completion tokens")
+    prompt_cost_per_1k: float = 0.0001
+    completion_cost_per_1k: float = 0.0004
+
+    # Cache Configuration
+    llm_cache_enabled: bool = True
+    llm_cache_path: str = ".llm_cache.db"
 
     # Simulation Configuration
-    default_member_count: int = Field(default=50, description="Default number of DPR members to simulate")
-    batch_size: int = Field(default=10, description="Batch size for processing members")
-    rate_limit_delay: float = Field(default=1.0, description="Delay between batches in seconds")
+    default_member_count: int = 50
+    batch_size: int = 10
+    autobatch_window_ms: float = 10.0
+    rate_limit_delay: float = 1.0
 
     # UI Configuration
-    gradio_server_name: str = Field(default="127.0.0.1", description="Gradio server host")
-    gradio_server_port: int = Field(default=7860, description="Gradio server port")
-    gradio_share: bool = Field(default=False, description="Share Gradio app publicly")
+    gradio_server_name: str = "127.0.0.1"
+    gradio_server_port: int = 7860
+    gradio_share: bool = False
+
+
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
 
-    model_config = {
-        "extra": "ignore",
-    }
+def _load_settings() -> Settings:
+    """Build Settings from the environment, converting by field type."""
+    values = {}
+    for field in fields(Settings):
+        raw = os.environ.get(field.name.upper())
+        if raw is None:
+            continue
+        if field.type is bool:
+            values[field.name] = raw.strip().lower() in _TRUTHY
+        elif field.type is int:
+            values[field.name] = int(raw)
+        elif field.type is float:
+            values[field.name] = float(raw)
+        else:
+            values[field.name] = raw
+    return Settings(**values)
 
 
 @lru_cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
-    return Settings()
+    return _load_settings()
 
 
 settings = get_settings()
@@ -1,11 +1,12 @@
 """Absorb (Menyerap) agent for processing aspirations."""
 
-import json
-from typing import Dict, Any
+import asyncio
+from typing import ClassVar, Dict, List, Any, Tuple
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from msgspec.structs import replace
 
-from .base import BaseAgent
+from .base import AutoBatcher, BaseAgent
+from ...config import settings
 from ...models import DPRMember, Aspirasi, AbsorpsiResponse
 
 
@@ -16,31 +17,32 @@ class AbsorbAgent(BaseAgent):
     Agent for Step 1: Menyerap (Absorb)
     
     AI agent absorbs and understands the aspiration from a DPR member's perspective.
-    """
-
-    def get_system_prompt(self) -> str:
-        return """Anda adalah seorang anggota DPR RI yang bertugas menyerap dan menganalisis aspirasi rakyat.
 
-Panduan Penilaian Relevansi:
-1. **PRIORITAS UTAMA (Fungsional)**: Jika aspirasi berkaitan dengan ruang lingkup KOMISI Anda, anggaplah RELEVANSI TINGGI meskipun bukan dari Dapil Anda. Anda bertanggung jawab secara nasional untuk bidang tersebut.
-2. **PRIORITAS KEDUA (Representasi)**: Jika aspirasi berasal dari DAPIL Anda, itu juga RELEVAN.
+    Members sharing the same (dapil, komisi, fraksi) profile receive
+    near-identical prompts and answers, so one LLM call per profile is made
+    and its response is cloned for the rest of the group.
+    """
 
-Tugas Anda adalah:
-1. Memahami aspirasi dari kacamata Ideologi Fraksi dan Kepentingan Dapil/Komisi Anda.
-2. Menentukan relevansi (Tinggi/Sedang/Rendah) sesuai panduan.
-3. Memberikan **TANGGAPAN LISAN (Quote)** yang mencerminkan persona politik Anda.
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._dedup: Dict[Tuple, AbsorpsiResponse] = {}
+        self._dedup_locks: Dict[Tuple, asyncio.Lock] = {}
+        self._batcher = AutoBatcher(
+            self._chain,
+            max_batch=settings.batch_size,
+            max_wait_ms=settings.autobatch_window_ms,
+        )
 
-Selalu berikan respons dalam format JSON yang valid."""
+    async def _ainvoke_uncached(self, user_prompt: str):
+        """Route concurrent single calls through the shared micro-batch window."""
+        return await self._batcher.submit(user_prompt)
 
-    def _build_user_prompt(self, member: DPRMember, aspirasi: Aspirasi) -> str:
-        ideologi = get_faction_persona(member.faction)
-        
-        return f"""Anda adalah anggota DPR RI dengan profil:
-{member.to_prompt_context()}
-Ideologi/Gaya Politik Fraksi ({member.faction}): {ideologi}
+    @staticmethod
+    def _dedup_key(member: DPRMember, aspirasi: Aspirasi) -> Tuple:
+        """Key identifying members whose absorption would be near-identical."""
+        return (member.dapil, member.komisi, member.faction, aspirasi.id)
 
-Aspirasi rakyat yang masuk:
-{aspirasi.to_prompt_context()}
+    _SYSTEM_PROMPT: ClassVar[str] = """Anda adalah seorang anggota DPR RI yang bertugas menyerap dan menganalisis aspirasi rakyat.
 
 Panduan Penilaian Relevansi:
 1. **CEK KOMISI**: Apakah topik aspirasi ini masuk lingkup Komisi Anda? Jika YA -> Relevansi TINGGI (Anda membahas kebijakan nasionalnya).
@@ -49,25 +51,73 @@ Panduan Penilaian Relevansi:
 4. **PENTING**: JANGAN menolak atau memberi relevansi Rendah hanya karena aspirasi bukan dari Dapil Anda, JIKA aspirasi tersebut masuk dalam wewenang Komisi Anda.
 
 Tugas Anda:
-1. Analisis aspirasi ini.
-2. Tentukan relevansi (Tinggi/Sedang/Rendah).
+1. Analisis aspirasi dari kacamata Ideologi Fraksi dan Kepentingan Dapil/Komisi Anda.
+2. Tentukan relevansi (Tinggi/Sedang/Rendah) sesuai panduan.
 3. Buat **QUOTE (Tanggapan Lisan)**:
-   - Gunakan gaya bicara politisi sesuai fraksi Anda ({member.faction}).
+   - Gunakan gaya bicara politisi sesuai fraksi Anda.
    - Jika PKS/PPP/PKB: Boleh gunakan istilah agamis/kerakyatan/pesantren jika relevan.
    - Jika PDIP/Gerindra: Gunakan nada nasionalis/tegas/wong cilik.
    - Jika Golkar/PAN/Demokrat: Gunakan nada teknokratis/pembangunan/solutif.
    - **PENTING**: Quote harus terdengar natural, seperti diwawancara wartawan atau berbicara di sidang paripurna. JANGAN KAKU.
 4. Tentukan **SENTIMENT** (Positif/Negatif/Netral/Kritis) terhadap isu ini.
 
-Berikan respons dalam format JSON:
-{{
+Selalu berikan respons dalam format JSON yang valid:
+{
     "relevansi": "Tinggi/Sedang/Rendah",
     "alasan_relevansi": "penjelasan singkat teknis (untuk internal)",
     "sentiment": "Positif/Negatif/Netral/Kritis",
     "quote": "Tanggapan lisan Anda di sini...",
     "poin_kunci": ["poin1", "poin2", ...],
     "rekomendasi_awal": "saran tindak lanjut"
-}}"""
+}"""
+
+    # Static fragments of the user prompt, materialized once; the per-call
+    # work is reduced to joining them with the dynamic pieces
+    _USER_PROFIL: ClassVar[str] = "Profil Anda:\n"
+    _USER_IDEOLOGI: ClassVar[str] = "\nIdeologi/Gaya Politik Fraksi ("
+    _USER_ASPIRASI: ClassVar[str] = "\n\nAspirasi rakyat yang masuk:\n"
+
+    def get_system_prompt(self) -> str:
+        return self._SYSTEM_PROMPT
+
+    def _build_user_prompt(self, member: DPRMember, aspirasi: Aspirasi) -> str:
+        return "".join(
+            (
+                self._USER_PROFIL,
+                member.prompt_context,
+                self._USER_IDEOLOGI,
+                member.faction,
+                "): ",
+                get_faction_persona(member.faction),
+                self._USER_ASPIRASI,
+                aspirasi.prompt_context,
+            )
+        )
+
+    @staticmethod
+    def _response_defaults() -> Dict[str, Any]:
+        """Fresh defaults for the fields parsed out of an absorb reply."""
+        return {
+            "relevansi": "rendah",
+            "alasan_relevansi": "",
+            "sentiment": "Netral",
+            "quote": "",
+            "poin_kunci": [],
+            "rekomendasi_awal": "",
+        }
+
+    def _to_response(
+        self, member: DPRMember, aspirasi: Aspirasi, response
+    ) -> AbsorpsiResponse:
+        """Convert a raw LLM response (or per-item exception) into an AbsorpsiResponse."""
+        data, cost, error = self._convert(response, self._response_defaults())
+        return AbsorpsiResponse(
+            member_id=member.id,
+            aspirasi_id=aspirasi.id,
+            error=error,
+            cost_usd=cost,
+            **data,
+        )
 
     async def invoke(
         self, member: DPRMember, aspirasi: Aspirasi
@@ -82,57 +132,95 @@ Berikan respons dalam format JSON:
         Returns:
             AbsorpsiResponse with the member's analysis
         """
-        messages = [
-            SystemMessage(content=self.get_system_prompt()),
-            HumanMessage(content=self._build_user_prompt(member, aspirasi)),
-        ]
-
-        cost = 0.0
-        try:
-            response = await self.llm.ainvoke(messages)
-
-            # Calculate cost from token usage
-            if hasattr(response, "response_metadata"):
-                usage = response.response_metadata.get("token_usage", {})
-                cost = self._calculate_cost(
-                    usage.get("prompt_tokens", 0),
-                    usage.get("completion_tokens", 0),
-                )
+        key = self._dedup_key(member, aspirasi)
+        shared = self._dedup.get(key)
+        if shared is None:
+            lock = self._dedup_locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                shared = self._dedup.get(key)
+                if shared is None:
+                    # _run includes the one-shot retry on unparseable replies
+                    data, cost, error = await self._run(
+                        self._build_user_prompt(member, aspirasi),
+                        self._response_defaults(),
+                    )
+                    shared = AbsorpsiResponse(
+                        member_id=member.id,
+                        aspirasi_id=aspirasi.id,
+                        error=error,
+                        cost_usd=cost,
+                        **data,
+                    )
+                    # Only successful responses are reused; errors stay retryable
+                    if shared.error is None:
+                        self._dedup[key] = shared
+
+        if shared.member_id == member.id:
+            return shared
+        return replace(shared, member_id=member.id, cost_usd=0.0)
+
+    async def invoke_many(
+        self, members: List[DPRMember], aspirasi: Aspirasi
+    ) -> List[AbsorpsiResponse]:
+        """
+        Process an aspiration for many members in one batched LLM request.
 
-            # Parse JSON response
-            content = response.content
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.startswith("```"):
-                content = content[3:]
-            if content.endswith("```"):
-                content = content[:-3]
-            content = content.strip()
-
-            result = json.loads(content)
-
-            return AbsorpsiResponse(
-                member_id=member.id,
-                aspirasi_id=aspirasi.id,
-                relevansi=result.get("relevansi", "rendah"),
-                alasan_relevansi=result.get("alasan_relevansi", ""),
-                sentiment=result.get("sentiment", "Netral"),
-                quote=result.get("quote", ""),
-                poin_kunci=result.get("poin_kunci", []),
-                rekomendasi_awal=result.get("rekomendasi_awal", ""),
-                cost_usd=cost,
-            )
+        Packs one prompt per distinct (dapil, komisi, fraksi) profile into a
+        single `abatch` call, then fans each profile's response out to all
+        members sharing it.
 
-        except Exception as e:
-            return AbsorpsiResponse(
-                member_id=member.id,
-                aspirasi_id=aspirasi.id,
-                relevansi="rendah",
-                alasan_relevansi="",
-                sentiment="Netral",
-                quote="",
-                poin_kunci=[],
-                rekomendasi_awal="",
-                error=str(e),
-                cost_usd=cost,
-            )
+        Args:
+            members: The DPR members processing the aspiration
+            aspirasi: The public aspiration to process
+
+        Returns:
+            List of AbsorpsiResponse in the same order as members
+        """
+        # One representative member per profile not already answered
+        pending: Dict[Tuple, DPRMember] = {}
+        for member in members:
+            key = self._dedup_key(member, aspirasi)
+            if key not in self._dedup and key not in pending:
+                pending[key] = member
+
+        if pending:
+            representatives = list(pending.values())
+            user_prompts = [
+                self._build_user_prompt(m, aspirasi) for m in representatives
+            ]
+            results = await self._cached_abatch(self.get_system_prompt(), user_prompts)
+
+            # Garbled replies earn one fresh batched attempt, mirroring
+            # BaseAgent._run (unparseable content is never cached, so the
+            # second call reaches the backend)
+            retry_indexes = [
+                i
+                for i, result in enumerate(results)
+                if not isinstance(result, Exception)
+                and not self._is_parseable(result.content)
+            ]
+            if retry_indexes:
+                fresh = await self._cached_abatch(
+                    self.get_system_prompt(),
+                    [user_prompts[i] for i in retry_indexes],
+                )
+                for i, result in zip(retry_indexes, fresh):
+                    results[i] = result
+
+            for key, member, result in zip(pending, representatives, results):
+                self._dedup[key] = self._to_response(member, aspirasi, result)
+
+        responses = []
+        for member in members:
+            shared = self._dedup[self._dedup_key(member, aspirasi)]
+            if shared.member_id == member.id:
+                responses.append(shared)
+            else:
+                responses.append(replace(shared, member_id=member.id, cost_usd=0.0))
+
+        # Errors stay retryable on the next batch
+        for key, shared in list(self._dedup.items()):
+            if shared.error is not None:
+                del self._dedup[key]
+
+        return responses
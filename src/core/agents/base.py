@@ -1,15 +1,180 @@
 """Base agent class for DPR AI Simulator."""
 
+import asyncio
+import sqlite3
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Any, Dict, List, Optional, Union
+
+import httpx
+import orjson
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.messages import AIMessage, BaseMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
 
 from ...config import settings
 
 
+class LLMCache:
+    """Disk-backed cache of LLM responses keyed by (model, system prompt, user prompt).
+
+    Identical prompt pairs are common when re-running simulations or when the
+    same aspirasi is dispatched to many similar members; a hit skips the API
+    call (and its cost) entirely.
+
+    The cache outlives any single run, and the UI executes successive
+    submissions on different worker threads, so the connection is opened
+    with ``check_same_thread=False`` and every statement runs under a lock.
+    """
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, "
+            "content TEXT NOT NULL, "
+            "prompt_tokens INTEGER NOT NULL, "
+            "completion_tokens INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, user_prompt: str) -> str:
+        """Hash the full prompt identity into a stable cache key."""
+        payload = "\0".join((model, system_prompt, user_prompt)).encode()
+        return blake2b(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response content, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(
+        self, key: str, content: str, prompt_tokens: int, completion_tokens: int
+    ) -> None:
+        """Store a response, replacing any previous entry for the same key."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?)",
+                (key, content, prompt_tokens, completion_tokens),
+            )
+            self._conn.commit()
+
+
+@lru_cache(maxsize=None)
+def _system_message(content: str) -> SystemMessage:
+    """Build the SystemMessage for a prompt once and reuse it across calls.
+
+    System prompts are class-level constants, so each agent class resolves to
+    a single shared message object instead of allocating one per invocation.
+    """
+    return SystemMessage(content=content)
+
+
+class AutoBatcher:
+    """Coalesce concurrent single LLM calls into one batched request.
+
+    Submissions arriving within ``max_wait_ms`` of the first (up to
+    ``max_batch`` of them) share a single ``abatch`` round-trip instead of
+    each opening its own HTTP request, at the cost of at most the window in
+    added latency.
+    """
+
+    def __init__(self, chain, max_batch: int, max_wait_ms: float):
+        self._chain = chain
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000.0
+        self._pending: List[tuple] = []
+        self._timer: Optional[asyncio.Task] = None
+        self._inflight: set = set()
+
+    async def submit(self, user_prompt: str) -> BaseMessage:
+        """Queue a prompt and wait for its response from the shared batch."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((user_prompt, future))
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._delayed_flush())
+        result = await future
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def _delayed_flush(self):
+        await asyncio.sleep(self._max_wait)
+        self._timer = None
+        self._flush()
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _run(self, batch):
+        try:
+            results = await self._chain.abatch(
+                [{"user": user_prompt} for user_prompt, _ in batch],
+                config={"max_concurrency": settings.batch_size},
+                return_exceptions=True,
+            )
+        except BaseException as e:
+            # abatch captures per-item failures; anything that escapes it
+            # (task cancellation, a pre-dispatch error in the chain) would
+            # otherwise leave every submitter awaiting an unresolved future
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+def make_http_client() -> httpx.AsyncClient:
+    """Build an async HTTP client (with HTTP/2 multiplexing) for agent traffic.
+
+    Sharing one pool across the agents of a run keeps concurrent absorb
+    calls on a handful of sockets instead of each ChatOpenAI instance
+    opening its own pool and redoing DNS/TLS. The pool's keepalive
+    connections bind to the event loop they first send on, so it must not
+    outlive that loop — share a client per simulator/run, never
+    process-wide.
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        http2=True,
+    )
+
+
+_llm_cache: Optional[LLMCache] = None
+
+
+def _get_llm_cache() -> Optional[LLMCache]:
+    """Return the process-wide response cache (None when disabled)."""
+    global _llm_cache
+    if not settings.llm_cache_enabled:
+        return None
+    if _llm_cache is None:
+        _llm_cache = LLMCache(settings.llm_cache_path)
+    return _llm_cache
+
+
 class BaseAgent(ABC):
     """Abstract base class for DPR AI Simulator agents."""
 
@@ -18,6 +183,7 @@ class BaseAgent(ABC):
         model: str | None = None,
         api_key: str | None = None,
         temperature: float = 0.7,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """
         Initialize the base agent.
@@ -26,17 +192,233 @@ class BaseAgent(ABC):
             model: OpenAI model name (defaults to settings)
             api_key: OpenAI API key (defaults to settings)
             temperature: Model temperature for response generation
+            http_client: Async HTTP client to send requests through. Pass the
+                same client to several agents to share one connection pool;
+                defaults to a private pool for this agent.
         """
         self.model_name = model or settings.openai_model
         self.api_key = api_key or settings.openai_api_key
         self.temperature = temperature
 
+        # Run-level usage accumulators for aggregated cost reporting
+        self.total_prompt_tokens = 0
+        self.total_completion_tokens = 0
+        self.total_cost_usd = 0.0
+
         self.llm = ChatOpenAI(
             model=self.model_name,
             api_key=self.api_key,
             temperature=self.temperature,
+            stream_usage=True,
+            # The client retries transient failures (connection errors, 429,
+            # 5xx) with backoff and fails fast on non-retryable 4xx.
+            max_retries=settings.llm_max_retries,
+            # Guarantees raw JSON output; every system prompt already demands
+            # a JSON response, which this mode requires.
+            model_kwargs={"response_format": {"type": "json_object"}},
+            http_async_client=http_client or make_http_client(),
+        )
+
+        # Compiled once so LangChain does not rebuild prompt state per call.
+        # The system message is passed as a concrete message (not a template),
+        # so braces in prompt text are never treated as format placeholders.
+        self._chain = (
+            ChatPromptTemplate.from_messages(
+                [_system_message(self.get_system_prompt()), ("human", "{user}")]
+            )
+            | self.llm
         )
-        self.json_parser = JsonOutputParser()
+
+    async def _cached_ainvoke(self, system_prompt: str, user_prompt: str) -> BaseMessage:
+        """Invoke the LLM, serving repeated (model, prompt) pairs from the disk cache.
+
+        ``system_prompt`` identifies the cache entry; the actual call goes
+        through the precompiled chain, which carries the same prompt. Cache
+        hits return a bare ``AIMessage`` with empty metadata, so the caller's
+        token accounting naturally bills them at zero cost.
+        """
+        cache = _get_llm_cache()
+        key = ""
+        if cache is not None:
+            key = LLMCache.make_key(self.model_name, system_prompt, user_prompt)
+            cached = cache.get(key)
+            if cached is not None:
+                return AIMessage(content=cached)
+
+        response = await self._ainvoke_uncached(user_prompt)
+
+        if cache is not None:
+            self._cache_response(cache, key, response)
+        return response
+
+    async def _ainvoke_uncached(self, user_prompt: str) -> BaseMessage:
+        """Send one prompt to the backend, bypassing the cache.
+
+        Streams and aggregates so network I/O overlaps chunk handling instead
+        of blocking until the last token arrives. Subclasses with heavy
+        concurrent single-call traffic may override this to batch instead.
+        """
+        response = None
+        async for chunk in self._chain.astream({"user": user_prompt}):
+            response = chunk if response is None else response + chunk
+        if response is None:
+            raise RuntimeError("LLM returned an empty stream")
+        return response
+
+    async def _cached_abatch(
+        self, system_prompt: str, user_prompts: List[str]
+    ) -> List[Union[BaseMessage, Exception]]:
+        """Batch-invoke the LLM over many user prompts, reusing cached entries.
+
+        Only cache misses go to the backend, packed into a single ``abatch``
+        call bounded by ``settings.batch_size`` concurrent requests. Per-item
+        failures are returned as exceptions so one bad call does not discard
+        the rest of the batch.
+        """
+        cache = _get_llm_cache()
+        responses: List[Union[BaseMessage, Exception, None]] = [None] * len(user_prompts)
+        keys = [""] * len(user_prompts)
+        miss_indexes: List[int] = []
+
+        if cache is not None:
+            for i, user_prompt in enumerate(user_prompts):
+                keys[i] = LLMCache.make_key(self.model_name, system_prompt, user_prompt)
+                cached = cache.get(keys[i])
+                if cached is not None:
+                    responses[i] = AIMessage(content=cached)
+                else:
+                    miss_indexes.append(i)
+        else:
+            miss_indexes = list(range(len(user_prompts)))
+
+        if miss_indexes:
+            results = await self._chain.abatch(
+                [{"user": user_prompts[i]} for i in miss_indexes],
+                config={"max_concurrency": settings.batch_size},
+                return_exceptions=True,
+            )
+            for i, result in zip(miss_indexes, results):
+                responses[i] = result
+                if cache is not None and not isinstance(result, Exception):
+                    self._cache_response(cache, keys[i], result)
+
+        return responses
+
+    @staticmethod
+    def _parse_json_content(content: str) -> Dict[str, Any]:
+        """Parse the JSON payload of a response.
+
+        ``response_format=json_object`` guarantees the model emits raw JSON,
+        so no Markdown-fence handling is needed.
+        """
+        return orjson.loads(content)
+
+    @classmethod
+    def _is_parseable(cls, content: str) -> bool:
+        """Whether a reply's content is valid JSON."""
+        try:
+            cls._parse_json_content(content)
+        except orjson.JSONDecodeError:
+            return False
+        return True
+
+    @classmethod
+    def _extract_fields(cls, content: str, defaults: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse a JSON response, keeping only the fields named in ``defaults``.
+
+        Anything else the model volunteered (stray keys, oversized values) is
+        dropped with the decoded dict as soon as this returns, so peak memory
+        stays bounded by the fields we actually use.
+        """
+        result = cls._parse_json_content(content)
+        return {key: result.get(key, default) for key, default in defaults.items()}
+
+    def _convert(
+        self, response: Union[BaseMessage, Exception], defaults: Dict[str, Any]
+    ) -> "tuple[Dict[str, Any], float, Optional[str]]":
+        """Turn a raw response (or per-item exception) into DTO building blocks.
+
+        Returns ``(fields, cost, error)``: the extracted fields (all defaults
+        on failure), the cost of the call, and the error message if any. This
+        is the shared tail of every agent's hot path.
+        """
+        cost = 0.0
+        try:
+            if isinstance(response, Exception):
+                raise response
+            cost = self._bill(response)
+            return self._extract_fields(response.content, defaults), cost, None
+        except Exception as e:
+            return dict(defaults), cost, str(e)
+
+    async def _run(
+        self, user_prompt: str, defaults: Dict[str, Any]
+    ) -> "tuple[Dict[str, Any], float, Optional[str]]":
+        """Invoke the LLM (cache-aware) and convert the outcome in one step.
+
+        Failures are handled by type: transient HTTP errors are retried by
+        the underlying client, an unparseable reply earns exactly one fresh
+        attempt (unparseable content is never cached, so the second call hits
+        the backend), and anything else degrades straight to the error
+        element, matching the pipeline's error-DTO convention.
+        """
+        system_prompt = self.get_system_prompt()
+        cost = 0.0
+        error: Optional[str] = None
+        for _ in range(2):
+            try:
+                response = await self._cached_ainvoke(system_prompt, user_prompt)
+            except Exception as e:
+                return dict(defaults), cost, str(e)
+            # Accumulated, not assigned: when the parse retry fires, the DTO
+            # must still report the spend of the first (wasted) call
+            cost += self._bill(response)
+            try:
+                return self._extract_fields(response.content, defaults), cost, None
+            except orjson.JSONDecodeError as e:
+                error = str(e)
+        return dict(defaults), cost, error
+
+    def _cache_response(
+        self, cache: LLMCache, key: str, response: BaseMessage
+    ) -> None:
+        """Store a response, refusing to cache unparseable content.
+
+        Caching a garbled reply would make every future run fail the same
+        way; skipping it keeps the bad call retryable.
+        """
+        if not self._is_parseable(response.content):
+            return
+        prompt_tokens, completion_tokens = self._usage_tokens(response)
+        cache.put(key, response.content, prompt_tokens, completion_tokens)
+
+    @staticmethod
+    def _usage_tokens(response: BaseMessage) -> "tuple[int, int]":
+        """Return (prompt_tokens, completion_tokens) for a response.
+
+        Streamed responses aggregate usage into ``usage_metadata``; plain
+        responses carry it in ``response_metadata["token_usage"]``. Cache hits
+        have neither and bill as zero.
+        """
+        usage = getattr(response, "usage_metadata", None)
+        if usage:
+            return usage.get("input_tokens", 0), usage.get("output_tokens", 0)
+        metadata = getattr(response, "response_metadata", None) or {}
+        usage = metadata.get("token_usage", {})
+        return usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0)
+
+    def _bill(self, response: BaseMessage) -> float:
+        """Account a response's token usage and return the cost of the call.
+
+        Also feeds the per-agent run totals, so a whole simulation's spend
+        can be read off the agents without re-walking every response DTO.
+        """
+        prompt_tokens, completion_tokens = self._usage_tokens(response)
+        cost = self._calculate_cost(prompt_tokens, completion_tokens)
+        self.total_prompt_tokens += prompt_tokens
+        self.total_completion_tokens += completion_tokens
+        self.total_cost_usd += cost
+        return cost
 
     def _calculate_cost(self, prompt_tokens: int, completion_tokens: int) -> float:
         """Calculate the cost based on token usage."""
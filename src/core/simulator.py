@@ -16,6 +16,7 @@ from ..models import (
 )
 from .member_factory import DPRMemberFactory
 from .agents import AbsorbAgent, CompileAgent, FollowUpAgent
+from .agents.base import make_http_client
 
 
 class DPRSimulator:
@@ -43,10 +44,29 @@ class DPRSimulator:
         self.api_key = api_key or settings.openai_api_key
         self.model = model or settings.openai_model
 
-        # Initialize agents
-        self.absorb_agent = AbsorbAgent(api_key=self.api_key, model=self.model)
-        self.compile_agent = CompileAgent(api_key=self.api_key, model=self.model)
-        self.followup_agent = FollowUpAgent(api_key=self.api_key, model=self.model)
+        # One connection pool shared by all three agents. Scoped to this
+        # simulator (not the process) because its keepalive connections bind
+        # to the event loop they first send on — the UI runs each submission
+        # on a fresh loop, with a fresh simulator.
+        self._http_client = make_http_client()
+
+        # Initialize agents. An explicit model overrides every stage;
+        # otherwise each stage may route to its own (cheaper) model.
+        self.absorb_agent = AbsorbAgent(
+            api_key=self.api_key,
+            model=model or settings.absorb_model,
+            http_client=self._http_client,
+        )
+        self.compile_agent = CompileAgent(
+            api_key=self.api_key,
+            model=model or settings.compile_model,
+            http_client=self._http_client,
+        )
+        self.followup_agent = FollowUpAgent(
+            api_key=self.api_key,
+            model=model or settings.followup_model,
+            http_client=self._http_client,
+        )
 
         # Initialize members
         self.members: List[DPRMember] = []
@@ -77,9 +97,7 @@ class DPRSimulator:
         progress_callback: Optional[Callable[[str], None]] = None,
     ) -> List[AbsorpsiResponse]:
         """Process a batch of members for the absorb stage."""
-        tasks = [self.absorb_agent.invoke(member, aspirasi) for member in members]
-        results = await asyncio.gather(*tasks)
-        return list(results)
+        return await self.absorb_agent.invoke_many(members, aspirasi)
 
     async def process_aspirasi(
         self,
@@ -146,11 +164,6 @@ class DPRSimulator:
             log("✅ Step 3 selesai")
         else:
             tindak_lanjut = TindakLanjutResponse(
-                langkah_tindak_lanjut=[],
-                komisi_penanggung_jawab="",
-                timeline="",
-                indikator_keberhasilan=[],
-                mekanisme="",
                 error="Tidak ada tindak lanjut karena aspirasi tidak relevan",
             )
             log("⚠️ Step 3 dilewati: Tidak ada tanggapan relevan")
@@ -1,5 +1,7 @@
 """Aspirasi (Public Aspiration) model."""
 
+from functools import cached_property
+
 from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Literal
@@ -22,8 +24,13 @@ class Aspirasi(BaseModel):
     def __str__(self) -> str:
         return f"[{self.priority.upper()}] {self.category}: {self.content[:50]}..."
 
-    def to_prompt_context(self) -> str:
-        """Generate context string for LLM prompts."""
+    @cached_property
+    def prompt_context(self) -> str:
+        """Context string for LLM prompts, rendered once per aspiration.
+
+        One aspirasi is shared across all sampled members, so the formatted
+        string is built a single time per run.
+        """
         return (
             f"Kategori: {self.category}\n"
             f"Sumber: {self.source}\n"
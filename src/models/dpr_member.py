@@ -1,5 +1,7 @@
 """DPR Member model."""
 
+from functools import cached_property
+
 from pydantic import BaseModel, Field
 from typing import List
 
@@ -21,8 +23,13 @@ class DPRMember(BaseModel):
     def __str__(self) -> str:
         return f"{self.name} ({self.faction}, {self.komisi}) - {self.dapil}, {self.province}"
 
-    def to_prompt_context(self) -> str:
-        """Generate context string for LLM prompts."""
+    @cached_property
+    def prompt_context(self) -> str:
+        """Context string for LLM prompts, rendered once per member.
+
+        Member profiles never change during a run, so the formatted string is
+        reused across every aspiration the member processes.
+        """
         return (
             f"Nama: {self.name}\n"
             f"Fraksi: {self.faction}\n"
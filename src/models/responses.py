@@ -1,104 +1,98 @@
-"""Response models for DPR AI Simulator pipeline stages."""
+"""Response models for DPR AI Simulator pipeline stages.
+
+These are outputs the agents construct themselves, so they use
+``msgspec.Struct`` instead of Pydantic: construction skips validation
+entirely, which matters when a run builds one response per member per
+aspiration. Validated Pydantic models are kept for the inputs
+(``DPRMember``/``Aspirasi``) that cross the application boundary.
+
+Structs are slotted (no per-instance ``__dict__``), and the per-call
+stage responses additionally opt out of cyclic GC tracking with
+``gc=False`` — they only ever hold scalars and flat lists, so they can
+never participate in a reference cycle.
+"""
 
-from pydantic import BaseModel, Field
-from typing import List, Optional
 from datetime import datetime
+from typing import List, Optional
+
+import msgspec
+from msgspec import field
 
 from .dpr_member import DPRMember
 from .aspirasi import Aspirasi
 
 
-class AbsorpsiResponse(BaseModel):
+class AbsorpsiResponse(msgspec.Struct, gc=False):
     """Response from the Menyerap (Absorb) stage."""
 
-    member_id: int = Field(..., description="ID of the responding member")
-    aspirasi_id: int = Field(..., description="ID of the aspiration being processed")
-    relevansi: str = Field(..., description="Relevance level: Tinggi/Sedang/Rendah")
-    alasan_relevansi: str = Field(..., description="Explanation of relevance")
-    poin_kunci: List[str] = Field(default_factory=list, description="Key points identified")
-    rekomendasi_awal: str = Field(default="", description="Initial recommendation")
-    sentiment: str = Field(default="Netral", description="Member's stance: Positif/Negatif/Kritis/Netral")
-    quote: str = Field(default="", description="Direct verbal statement/opinion from the member")
-    error: Optional[str] = Field(default=None, description="Error message if any")
-    cost_usd: float = Field(default=0.0, description="Cost of this API call in USD")
+    member_id: int
+    aspirasi_id: int
+    relevansi: str
+    alasan_relevansi: str
+    poin_kunci: List[str] = field(default_factory=list)
+    rekomendasi_awal: str = ""
+    sentiment: str = "Netral"
+    quote: str = ""
+    error: Optional[str] = None
+    cost_usd: float = 0.0
 
 
-class KompilasiResponse(BaseModel):
+class KompilasiResponse(msgspec.Struct, gc=False):
     """Response from the Menghimpun (Compile) stage."""
 
-    status: str = Field(..., description="Status: terkumpul/tidak_relevan")
-    jumlah_anggota: int = Field(default=0, description="Number of members who responded")
-    ringkasan: str = Field(default="", description="Summary of consensus")
-    tema_utama: List[str] = Field(default_factory=list, description="Main themes identified")
-    fraksi_terlibat: List[str] = Field(default_factory=list, description="Factions involved")
-    rekomendasi_tindak_lanjut: str = Field(default="", description="Follow-up recommendation")
-    error: Optional[str] = Field(default=None, description="Error message if any")
-    cost_usd: float = Field(default=0.0, description="Cost of this API call in USD")
+    status: str
+    jumlah_anggota: int = 0
+    ringkasan: str = ""
+    tema_utama: List[str] = field(default_factory=list)
+    fraksi_terlibat: List[str] = field(default_factory=list)
+    rekomendasi_tindak_lanjut: str = ""
+    error: Optional[str] = None
+    cost_usd: float = 0.0
 
 
-class TindakLanjutResponse(BaseModel):
+class TindakLanjutResponse(msgspec.Struct, gc=False):
     """Response from the Menindaklanjuti (Follow-up) stage."""
 
-    langkah_tindak_lanjut: List[str] = Field(
-        default_factory=list, description="Concrete follow-up steps"
-    )
-    komisi_penanggung_jawab: str = Field(
-        default="", description="Responsible commission"
-    )
-    timeline: str = Field(default="", description="Estimated timeline")
-    indikator_keberhasilan: List[str] = Field(
-        default_factory=list, description="Success indicators"
-    )
-    mekanisme: str = Field(
-        default="", description="Mechanism: RDP/Hearing/Kunjungan Kerja/etc."
-    )
-    estimasi_anggaran: str = Field(
-        default="", description="Budget estimation for the proposed solution"
-    )
-    rincian_anggaran: List[str] = Field(
-        default_factory=list, description="Detailed budget breakdown per item"
-    )
-    sumber_dana: str = Field(
-        default="", description="Proposed funding sources (APBN/APBD/etc)"
-    )
-    error: Optional[str] = Field(default=None, description="Error message if any")
-    cost_usd: float = Field(default=0.0, description="Cost of this API call in USD")
-
-
-class SimulationDetails(BaseModel):
+    langkah_tindak_lanjut: List[str] = field(default_factory=list)
+    komisi_penanggung_jawab: str = ""
+    timeline: str = ""
+    indikator_keberhasilan: List[str] = field(default_factory=list)
+    mekanisme: str = ""
+    estimasi_anggaran: str = ""
+    rincian_anggaran: List[str] = field(default_factory=list)
+    sumber_dana: str = ""
+    error: Optional[str] = None
+    cost_usd: float = 0.0
+
+
+class SimulationDetails(msgspec.Struct):
     """Details about the simulation setup and member selection."""
-    
-    total_anggota_dpr: int = Field(default=0, description="Total DPR members in simulation")
-    sample_size_requested: int = Field(default=0, description="Requested sample size")
-    anggota_relevan_terpilih: int = Field(default=0, description="Number of relevant members selected")
-    anggota_merespons: int = Field(default=0, description="Number of members who responded")
-    anggota_relevansi_tinggi: int = Field(default=0, description="Members with high relevance")
-    anggota_relevansi_sedang: int = Field(default=0, description="Members with medium relevance")
-    anggota_relevansi_rendah: int = Field(default=0, description="Members with low relevance")
-    fraksi_terwakili: List[str] = Field(default_factory=list, description="Factions represented")
-    provinsi_terwakili: List[str] = Field(default_factory=list, description="Provinces represented")
-    komisi_terwakili: List[str] = Field(default_factory=list, description="Commissions represented")
-    komisi_utama: str = Field(default="", description="Primary responsible commission")
+
+    total_anggota_dpr: int = 0
+    sample_size_requested: int = 0
+    anggota_relevan_terpilih: int = 0
+    anggota_merespons: int = 0
+    anggota_relevansi_tinggi: int = 0
+    anggota_relevansi_sedang: int = 0
+    anggota_relevansi_rendah: int = 0
+    fraksi_terwakili: List[str] = field(default_factory=list)
+    provinsi_terwakili: List[str] = field(default_factory=list)
+    komisi_terwakili: List[str] = field(default_factory=list)
+    komisi_utama: str = ""
     # IDs for building dataframes in UI
-    relevant_member_ids: List[int] = Field(default_factory=list, description="IDs of relevant members")
+    relevant_member_ids: List[int] = field(default_factory=list)
 
 
-class PipelineResult(BaseModel):
+class PipelineResult(msgspec.Struct):
     """Complete result from the DPR AI Simulator pipeline."""
 
-    aspirasi: Aspirasi = Field(..., description="The processed aspiration")
-    tanggapan_anggota: List[AbsorpsiResponse] = Field(
-        default_factory=list, description="Individual member responses"
-    )
-    kompilasi: KompilasiResponse = Field(..., description="Compiled response")
-    tindak_lanjut: TindakLanjutResponse = Field(..., description="Follow-up actions")
-    simulation_details: SimulationDetails = Field(
-        default_factory=SimulationDetails, description="Simulation setup details"
-    )
-    timestamp: datetime = Field(
-        default_factory=datetime.now, description="When processing completed"
-    )
-    total_cost_usd: float = Field(default=0.0, description="Total cost in USD")
+    aspirasi: Aspirasi
+    kompilasi: KompilasiResponse
+    tindak_lanjut: TindakLanjutResponse
+    tanggapan_anggota: List[AbsorpsiResponse] = field(default_factory=list)
+    simulation_details: SimulationDetails = field(default_factory=SimulationDetails)
+    timestamp: datetime = field(default_factory=datetime.now)
+    total_cost_usd: float = 0.0
 
     def summary(self) -> str:
         """Generate a human-readable summary."""
@@ -421,9 +421,11 @@ def create_app() -> gr.Blocks:
                     <div style='background: #1e3a5f; padding: 12px; border-radius: 8px; margin-top: 12px; border-left: 4px solid #3b82f6;'>
                     <strong style='color: #60a5fa;'>💡 Catatan Biaya API:</strong>
                     <p style='color: #e2e8f0; margin: 8px 0 0 0; font-size: 0.9em;'>
-                    Dengan <strong>default parameter</strong> (50 anggota DPR, sample size 20) dan menggunakan 
-                    contoh aspirasi <em>Banjir Rob Jakarta Utara</em>, biaya total pemrosesan hanya 
-                    <strong style='color: #34d399;'>$0.0025</strong> atau <strong style='color: #34d399;'>~Rp 41,6</strong>
+                    Dengan <strong>default parameter</strong> (50 anggota DPR, sample size 20) dan menggunakan
+                    contoh aspirasi <em>Banjir Rob Jakarta Utara</em>, biaya total pemrosesan maksimal sekitar
+                    <strong style='color: #34d399;'>$0.0025</strong> atau <strong style='color: #34d399;'>~Rp 41,6</strong> —
+                    seringkali lebih rendah, karena anggota dengan profil (Dapil, Komisi, Fraksi) yang sama berbagi satu
+                    panggilan API dan respons yang sudah pernah diproses dilayani gratis dari cache.
                     </p>
                     </div>
                     """, elem_classes="cost-note")
@@ -553,28 +555,31 @@ def create_app() -> gr.Blocks:
             gr.Markdown("""
 ### How Many API Calls Happen?
 
-**Formula: Total API Calls = N + 2**
+**Formula: Total API Calls = P + 2**
 
-Where **N** = sample size (number of DPR members processing the aspiration)
+Where **P** = the number of distinct member profiles — (Dapil, Komisi, Fraksi)
+combinations — among the sampled members. P is at most the sample size N, and
+usually much smaller.
 
 **The 3 Stages:**
-1. **Menyerap (Absorb):** N API calls - each DPR member independently analyzes the aspiration (Output: Relevance, Sentiment, Quote)
+1. **Menyerap (Absorb):** P API calls - members sharing a (Dapil, Komisi, Fraksi) profile get near-identical prompts, so one representative call is made per profile and its response (relevance, sentiment, quote) is reused for the rest of the group with only the member ID changed
 2. **Menghimpun (Compile):** 1 API call - aggregates all responses into consensus
 3. **Menindaklanjuti (Follow-up):** 1 API call - creates concrete action plan
 
-**Examples Breakdown:**
+**Examples Breakdown (worst case, every member a distinct profile):**
 
 | Sample Size | Stage 1 Calls | Stage 2 Calls | Stage 3 Calls | **Total API Calls** |
 | ----------- | ------------- | ------------- | ------------- | ------------------- |
-| 20 members  | 20            | 1             | 1             | **22**              |
-| 50 members  | 50            | 1             | 1             | **52**              |
-| 100 members | 100           | 1             | 1             | **102**             |
-| 575 members | 575           | 1             | 1             | **577**             |
+| 20 members  | ≤ 20          | 1             | 1             | **≤ 22**            |
+| 50 members  | ≤ 50          | 1             | 1             | **≤ 52**            |
+| 100 members | ≤ 100         | 1             | 1             | **≤ 102**           |
+| 575 members | ≤ 575         | 1             | 1             | **≤ 577**           |
 
 **Key Points:**
-- Each DPR member is a truly independent AI agent with unique context (name, faction, province, expertise)
-- Stage 1 processes members in parallel batches of 10 for efficiency
-- All API costs are tracked and displayed in the results
+- Members sharing a (Dapil, Komisi, Fraksi) profile share one absorb response — identical quotes in the responses table attributed to different members are these clones, billed at $0
+- Responses are also cached on disk keyed by (model, prompt), so re-running the same aspiration makes no new API calls at all
+- Stage 1 sends the distinct profiles in parallel batches of 10 for efficiency
+- All API costs are tracked and displayed in the results (cloned and cached responses cost $0)
             """)
 
         # Footer info